@@ -8,13 +8,166 @@ from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-import pandas as pd
+from selenium.common.exceptions import TimeoutException, WebDriverException
+import asyncio
+import aiohttp
+import requests
+import urllib3.exceptions
+from requests.adapters import HTTPAdapter
+import lxml.html
+from lxml import etree
+from lxml.cssselect import CSSSelector
+import csv
+import sqlite3
+import argparse
+import os
 import time
 import re
 import logging
+import logging.handlers
+import atexit
 import sys
+import signal
+import secrets
+import socket
 import traceback
-from datetime import datetime
+import queue
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait, FIRST_COMPLETED
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from contextlib import asynccontextmanager, contextmanager
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Connection, answer_challenge, deliver_challenge
+from datetime import datetime, timedelta
+from urllib.parse import urlparse, parse_qsl, urlencode, urlunparse
+
+# Separator line for log banners, and the clock format for start/finish times
+SEP = "=" * 60
+_H_M_S = "%H:%M:%S"
+
+# Write buffer for the log file - records reach disk in large chunks
+LOG_BUFFER_SIZE = 1024 * 1024
+
+# Maximum number of Chrome instances used for event pages that need JavaScript
+DRIVER_POOL_SIZE = 6
+
+# Page requests in flight at once across every URL thread, and the pause each
+# event fetch holds its slot for
+EVENT_CONCURRENCY = 16
+EVENT_REQUEST_DELAY = 0.1
+
+# Worker processes that parse event pages while the event loop keeps fetching
+PARSE_WORKERS = os.cpu_count() or 1
+
+# URLs from the command line scraped at the same time, one scraper per thread,
+# and how long an interrupted run waits for them to wind down before cleanup
+URL_WORKERS = 4
+URL_STOP_TIMEOUT = 30
+
+# Chrome processes alive at once across the whole process - the driver pool
+# plus the main scraper's own browser
+MAX_CHROME_PROCESSES = DRIVER_POOL_SIZE + 1
+
+USER_AGENT = ('Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+              '(KHTML, like Gecko) Chrome/120.0 Safari/537.36')
+
+# Size of the keep-alive HTTP connection pool used for plain page fetches
+HTTP_POOL_SIZE = 16
+
+# Retries after an HTTP 429, and the base back-off when the server sends no Retry-After
+RATE_LIMIT_RETRIES = 3
+RATE_LIMIT_BACKOFF = 5
+
+# Resources Chrome never needs to download for scraping
+BLOCKED_URL_PATTERNS = ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.svg", "*.woff*", "*.ttf",
+                        "*.css", "*.mp4", "*.webm", "*/ads/*"]
+
+# Maximum seconds to wait for a browser-rendered page to show the content we need
+PAGE_READY_TIMEOUT = 10
+
+# Seconds driver.quit() gets before chromedriver is killed outright
+DRIVER_QUIT_TIMEOUT = 5
+
+# What quit() raises when chromedriver has already died - usually a refused
+# connection from urllib3 rather than a WebDriverException
+_DRIVER_GONE_ERRORS = (WebDriverException, urllib3.exceptions.HTTPError, OSError)
+
+# CSV output - rows are streamed to this file as each event completes
+CSV_FILENAME = 'mtgtop8_decks.csv'
+CSV_FIELDNAMES = ['event_name', 'event_date', 'event_url', 'deck_position',
+                  'deck_name', 'player_name', 'deck_url']
+CSV_BUFFER_SIZE = 1 << 20
+
+# A --serve instance writes its own CSV, so a run that scrapes in-process while
+# the server is busy never truncates the file the server is appending to
+SERVER_CSV_FILENAME = 'mtgtop8_decks_server.csv'
+
+# Per-user directory for the page cache and the server key
+USER_DATA_DIR = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~')
+
+# On-disk cache of event pages - repeated runs read them from here instead of the
+# network. List pages are never cached, so new tournaments always show up
+CACHE_PATH = os.path.join(USER_DATA_DIR, 'mtgtop8_cache.sqlite')
+CACHE_EXPIRE_AFTER = timedelta(days=2)
+
+# Local address of a warm --serve instance that later invocations hand their URLs to,
+# and the file holding the random key both sides authenticate with
+SERVER_ADDRESS = ('127.0.0.1', 6437)
+SERVER_KEY_PATH = os.path.join(USER_DATA_DIR, 'mtgtop8_server.key')
+
+# Seconds a client waits to connect and authenticate before scraping in-process,
+# and that the server gives an accepted client to finish the handshake
+SERVER_CONNECT_TIMEOUT = 5
+
+# Selectors and patterns compiled once and reused for every page
+_DATE_RE = re.compile(r'\d{2}/\d{2}/\d{2}')
+_STABLE_TABLES = CSSSelector("table.Stable")
+_EVENT_LINKS = CSSSelector("a[href*='event?e=']")
+_DECK_LINKS = CSSSelector("a[href*='&d=']")
+_NAV_DIVS = CSSSelector("div.Nav_norm")
+_NEXT_LINK = etree.XPath(".//a[contains(translate(text(), 'NEXT', 'next'), 'next')]")
+
+# Link filters - class attributes are split into tokens once and tested by set membership
+_SKIP_EVENT_CLASSES = frozenset({'und'})
+_DISABLED_PAGE_CLASS = 'Nav_PN_no'
+
+# Every live Chrome holds a slot from create_chrome_driver() until quit_driver()
+_CHROME_SLOTS = threading.BoundedSemaphore(MAX_CHROME_PROCESSES)
+_SLOTTED_DRIVERS = set()
+
+class BufferedFileHandler(logging.StreamHandler):
+    """Log to a file through a large write buffer, flushing only on errors"""
+    def __init__(self, filename, buffer_size=LOG_BUFFER_SIZE):
+        super().__init__(open(filename, 'a', buffering=buffer_size, encoding='utf-8'))
+    
+    def emit(self, record):
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.ERROR:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+    
+    def close(self):
+        self.acquire()
+        try:
+            if self.stream:
+                self.stream.flush()
+                self.stream.close()
+                self.stream = None
+        finally:
+            self.release()
+            super().close()
+
+def flush_logging(logger):
+    """Push buffered records all the way to disk"""
+    for handler in logger.handlers:
+        handler.flush()
+        target = getattr(handler, 'target', None)
+        if target is not None:
+            target.flush()
 
 def setup_logging():
     """Setup simple, safe logging to both file and console"""
@@ -31,8 +184,9 @@ def setup_logging():
         logger.removeHandler(handler)
     
     # Create file handler
-    file_handler = logging.FileHandler(log_filename, encoding='utf-8')
+    file_handler = BufferedFileHandler(log_filename)
     file_handler.setLevel(logging.DEBUG)
+    atexit.register(file_handler.close)
     
     # Create console handler
     console_handler = logging.StreamHandler(sys.stdout)
@@ -43,283 +197,479 @@ def setup_logging():
     file_handler.setFormatter(formatter)
     console_handler.setFormatter(logging.Formatter('%(message)s'))
     
-    # Add handlers to logger
-    logger.addHandler(file_handler)
+    # Buffer file records in memory and write them in batches - errors (and
+    # shutdown) flush immediately so nothing important is stuck in the buffer
+    buffered_file_handler = logging.handlers.MemoryHandler(
+        capacity=512,
+        flushLevel=logging.ERROR,
+        target=file_handler,
+        flushOnClose=True
+    )
+    buffered_file_handler.setLevel(logging.DEBUG)
+    atexit.register(buffered_file_handler.flush)
+    
+    # Add handlers to logger - console stays direct so progress is live
+    logger.addHandler(buffered_file_handler)
     logger.addHandler(console_handler)
     
     return logger, log_filename
 
+def create_chrome_driver(wait=True):
+    """Create a Chrome WebDriver, or return None when wait=False and every Chrome slot is taken"""
+    # Set up Chrome options for Windows x64
+    chrome_options = webdriver.ChromeOptions()
+    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    chrome_options.add_experimental_option('useAutomationExtension', False)
+    
+    # The scraper only reads the DOM - no window, no images, and get() returns
+    # as soon as the DOM is ready instead of waiting for every subresource
+    chrome_options.add_argument("--headless=new")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--window-size=1920,1080")
+    chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+    
+    # Skip background services that slow startup and burn idle CPU
+    chrome_options.add_argument("--disable-extensions")
+    chrome_options.add_argument("--disable-background-networking")
+    chrome_options.add_argument("--disable-sync")
+    chrome_options.add_argument("--metrics-recording-only")
+    chrome_options.add_argument("--mute-audio")
+    chrome_options.page_load_strategy = 'eager'
+    
+    if not _CHROME_SLOTS.acquire(blocking=wait):
+        return None
+    try:
+        driver = webdriver.Chrome(options=chrome_options)
+    except BaseException:
+        _CHROME_SLOTS.release()
+        raise
+    _SLOTTED_DRIVERS.add(driver)
+    
+    # Block the remaining heavy requests (fonts, styles, media, ads) at the network layer
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+    except BaseException:
+        quit_driver(driver)
+        raise
+    return driver
+
+def quit_driver(driver, timeout=DRIVER_QUIT_TIMEOUT):
+    """Quit a Chrome driver, killing chromedriver if quit() hangs - False if it was already gone"""
+    executor = ThreadPoolExecutor(max_workers=1)
+    try:
+        executor.submit(driver.quit).result(timeout=timeout)
+    except FuturesTimeoutError:
+        logging.getLogger('MTGTop8Scraper').warning(f"⚠️  Browser did not quit within {timeout}s - killing chromedriver")
+        try:
+            os.kill(driver.service.process.pid, signal.SIGTERM)
+        except (AttributeError, OSError):
+            pass
+    except _DRIVER_GONE_ERRORS:
+        return False
+    finally:
+        executor.shutdown(wait=False)
+        release_chrome_slot(driver)
+    return True
+
+def release_chrome_slot(driver):
+    """Give back the Chrome slot `driver` holds - safe to call more than once"""
+    try:
+        _SLOTTED_DRIVERS.remove(driver)
+    except KeyError:
+        return
+    _CHROME_SLOTS.release()
+
+def flatten_event(event):
+    """Yield one CSV row per deck of an extracted event, in CSV_FIELDNAMES order"""
+    event_name, event_date, event_url = event['event_name'], event['event_date'], event['event_url']
+    for deck in event['decks']:
+        yield (event_name, event_date, event_url, deck['deck_position'],
+               deck['deck_name'], deck['player_name'], deck['deck_url'])
+
+def parse_event_document(doc, event_url, event_name):
+    """Extract the date and deck list from a parsed event page"""
+    # Extract date
+    date = "Unknown"
+    date_match = _DATE_RE.search(doc.text_content())
+    if date_match:
+        date = date_match.group()
+    
+    # Extract deck information
+    decks = []
+    position_counter = 1
+    for link in _DECK_LINKS(doc):
+        deck_name = link.text_content().strip()
+        deck_url = link.get('href')
+        
+        if deck_name and deck_url and '&d=' in deck_url:
+            decks.append({
+                'deck_position': position_counter,
+                'deck_name': deck_name,
+                'player_name': 'Unknown',  # Can be improved later
+                'deck_url': deck_url
+            })
+            position_counter += 1
+    
+    return {
+        'event_name': event_name,
+        'event_date': date,
+        'event_url': event_url,
+        'total_decks': len(decks),
+        'decks': decks
+    }
+
+def parse_event_html(content, base_url, event_url, event_name):
+    """Parse a downloaded event page in a worker process - None if it has no deck links"""
+    doc = lxml.html.fromstring(content, base_url=base_url)
+    if not _DECK_LINKS(doc):
+        return None
+    doc.make_links_absolute(base_url)
+    return parse_event_document(doc, event_url, event_name)
+
+def retry_delay(headers, attempt):
+    """Seconds to wait before retrying a rate-limited (HTTP 429) request"""
+    retry_after = headers.get('Retry-After', '')
+    if retry_after.isdigit():
+        return int(retry_after)
+    return RATE_LIMIT_BACKOFF * 2 ** attempt
+
+def page_number_of(url):
+    """Return the cp= (page number) query parameter of `url`, or 1 if it has none"""
+    for key, value in parse_qsl(urlparse(url).query):
+        if key == 'cp' and value.isdigit():
+            return int(value)
+    return 1
+
+def page_url_for(url, page):
+    """Return `url` with its cp= (page number) query parameter set to `page`"""
+    parts = urlparse(url)
+    query = [(key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True) if key != 'cp']
+    query.append(('cp', str(page)))
+    return urlunparse(parts._replace(query=urlencode(query)))
+
+def link_classes(link):
+    """Return the set of CSS classes on an lxml link element"""
+    return frozenset((link.get('class') or "").split())
+
+class DriverPool:
+    """Bounded pool of Chrome drivers shared by worker threads, started only when a page needs one"""
+    def __init__(self, size=DRIVER_POOL_SIZE):
+        self.logger = logging.getLogger('MTGTop8Scraper')
+        self.size = size
+        self._idle = queue.Queue()
+        self._drivers = []
+        self._lock = threading.Lock()
+    
+    @contextmanager
+    def checkout(self):
+        """Borrow a driver for the duration of a with-block"""
+        driver = None
+        try:
+            driver = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                if len(self._drivers) < self.size:
+                    # Only wait for a Chrome slot when there's no pooled browser to wait for instead
+                    driver = create_chrome_driver(wait=not self._drivers)
+                    if driver is not None:
+                        self._drivers.append(driver)
+                        self.logger.debug("Started pooled Chrome instance %s/%s", len(self._drivers), self.size)
+        if driver is None:
+            driver = self._idle.get()
+        
+        try:
+            yield driver
+        finally:
+            self._idle.put(driver)
+    
+    def close(self):
+        """Quit every driver in the pool"""
+        for driver in self._drivers:
+            try:
+                quit_driver(driver)
+            except Exception as e:
+                self.logger.error(f"❌ Error closing pooled browser: {e}")
+        self._drivers = []
+
+class RequestSlots:
+    """Process-wide cap on page requests in flight, usable from any thread or event loop"""
+    def __init__(self, limit=EVENT_CONCURRENCY):
+        self._slots = threading.BoundedSemaphore(limit)
+        # Async waiters block here, not on the loop's executor that runs Selenium fallbacks
+        self._waiters = ThreadPoolExecutor(max_workers=limit, thread_name_prefix='request-slot')
+    
+    def __enter__(self):
+        self._slots.acquire()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        self._slots.release()
+        return False
+    
+    async def __aenter__(self):
+        if self._slots.acquire(blocking=False):
+            return self
+        acquired = self._waiters.submit(self._slots.acquire)
+        try:
+            await asyncio.shield(asyncio.wrap_future(acquired))
+        except asyncio.CancelledError:
+            # The waiter thread still gets the slot - hand it straight back. This
+            # callback runs on the waiter thread, so it works even once the loop is gone
+            acquired.add_done_callback(lambda future: future.cancelled() or self._slots.release())
+            raise
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, exc_traceback):
+        self._slots.release()
+        return False
+
+class CachedFetcher:
+    """SQLite store of event page HTML keyed by URL - with `path=None` nothing is cached"""
+    def __init__(self, path=CACHE_PATH, expire_after=CACHE_EXPIRE_AFTER):
+        self.logger = logging.getLogger('MTGTop8Scraper')
+        self.expire_after = expire_after.total_seconds()
+        self._lock = threading.Lock()
+        self._db = None
+        if path is None:
+            return
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS pages ("
+            "url TEXT PRIMARY KEY, final_url TEXT, content BLOB, fetched_at REAL)"
+        )
+        self._db.commit()
+        
+        # Drop expired pages so the file doesn't grow with every run
+        try:
+            self._db.execute("DELETE FROM pages WHERE fetched_at < ?", (time.time() - self.expire_after,))
+            self._db.commit()
+        except sqlite3.Error as e:
+            self._db.rollback()
+            self.logger.warning(f"⚠️  Could not purge expired cache pages: {e}")
+    
+    def get(self, url):
+        """Return the cached (content, final_url) for `url`, or None on a miss"""
+        if self._db is None:
+            return None
+        try:
+            with self._lock:
+                row = self._db.execute(
+                    "SELECT content, final_url FROM pages WHERE url = ? AND fetched_at >= ?",
+                    (url, time.time() - self.expire_after)
+                ).fetchone()
+        except sqlite3.Error as e:
+            self.logger.warning(f"⚠️  Page cache read failed for {url}: {e}")
+            return None
+        if row is not None:
+            self.logger.debug("Cache hit for %s", url)
+        return row
+    
+    def put(self, url, content, final_url):
+        """Store a page that had the content the scraper needs"""
+        if self._db is None:
+            return
+        with self._lock:
+            try:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO pages (url, final_url, content, fetched_at) VALUES (?, ?, ?, ?)",
+                    (url, final_url, content, time.time())
+                )
+                self._db.commit()
+            except sqlite3.Error as e:
+                self._db.rollback()
+                self.logger.warning(f"⚠️  Page cache write failed for {url}: {e}")
+    
+    def close(self):
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+class DeckCSVWriter:
+    """Thread-safe CSV sink shared by every scraper in a run"""
+    def __init__(self, filename=CSV_FILENAME):
+        self.filename = filename
+        self.file = None
+        self.writer = None
+        self.events_saved = 0
+        self.decks_saved = 0
+        self._lock = threading.Lock()
+    
+    def write_event(self, event_data):
+        """Append one event's decks to the CSV - rows reach disk as the buffer fills"""
+        with self._lock:
+            # Opened on the first event, so a run that scrapes nothing keeps the previous CSV
+            if self.file is None:
+                self.file = open(self.filename, 'w', newline='', encoding='utf-8',
+                                 buffering=CSV_BUFFER_SIZE)
+                self.writer = csv.writer(self.file)
+                self.writer.writerow(CSV_FIELDNAMES)
+            self.writer.writerows(flatten_event(event_data))
+            self.events_saved += 1
+            self.decks_saved += event_data['total_decks']
+    
+    def flush(self):
+        """Push buffered rows to disk without closing the file"""
+        with self._lock:
+            if self.file is not None and not self.file.closed:
+                self.file.flush()
+    
+    def close(self):
+        with self._lock:
+            if self.file is not None and not self.file.closed:
+                self.file.close()
+
 class MTGTop8URLScraper:
-    def __init__(self):
-        """Initialize the scraper with Chrome"""
+    def __init__(self, parent=None, use_cache=True, csv_filename=CSV_FILENAME):
+        """Initialize the scraper - with a `parent`, share its driver pool, CSV, cache and request budget"""
+        self.parent = parent
         self.logger = logging.getLogger('MTGTop8Scraper')
         self.logger.info("🚀 Initializing MTGTop8 URL-Based Scraper...")
-        self.logger.info("🔧 Using Chrome browser...")
         
-        # Set up Chrome options for Windows x64
-        chrome_options = webdriver.ChromeOptions()
-        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        chrome_options.add_experimental_option('useAutomationExtension', False)
+        # Plain HTTP session for pages that don't need JavaScript
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({'User-Agent': USER_AGENT})
+        
+        self.driver = None
+        if parent is not None:
+            self.driver_pool = parent.driver_pool
+            self.output = parent.output
+            self.parse_pool = parent.parse_pool
+            self.cache = parent.cache
+            self.stop_requested = parent.stop_requested
+            self.request_slots = parent.request_slots
+            return
         
         try:
-            self.driver = webdriver.Chrome(options=chrome_options)
-            self.driver.maximize_window()
-            self.wait = WebDriverWait(self.driver, 15)
+            # Fallback browsers for event pages that need JavaScript
+            self.driver_pool = DriverPool(DRIVER_POOL_SIZE)
+            
+            # Rows are streamed into the CSV as events complete
+            self.output = DeckCSVWriter(csv_filename)
+            
+            # Worker processes are only spawned once the first event page is parsed
+            self.parse_pool = ProcessPoolExecutor(max_workers=PARSE_WORKERS)
+            
+            self.cache = CachedFetcher(CACHE_PATH if use_cache else None)
             
-            self.all_events_data = []
-            self.logger.info("✅ Chrome browser initialized successfully!")
+            # Set when main() is interrupted - scrapers on worker threads wind down
+            self.stop_requested = threading.Event()
             
+            # One budget of in-flight requests to mtgtop8.com for every URL thread
+            self.request_slots = RequestSlots(EVENT_CONCURRENCY)
         except Exception as e:
-            self.logger.error(f"❌ Failed to initialize Chrome: {e}")
-            self.logger.error("💡 Make sure ChromeDriver is installed and in your PATH")
-            self.logger.error("💡 Download from: https://chromedriver.chromium.org/downloads")
+            self.logger.error(f"❌ Failed to initialize scraper: {e}")
+            self.close()
             raise
-        
+    
+    def get_driver(self):
+        """Return the scraper's own browser, starting Chrome the first time it is needed"""
+        if self.driver is None:
+            try:
+                self.logger.info("🔧 Using Chrome browser...")
+                self.driver = create_chrome_driver()
+                self.logger.info("✅ Chrome browser initialized successfully!")
+            except Exception as e:
+                self.logger.error(f"❌ Failed to initialize Chrome: {e}")
+                self.logger.error("💡 Make sure ChromeDriver is installed and in your PATH")
+                self.logger.error("💡 Download from: https://chromedriver.chromium.org/downloads")
+                raise
+        return self.driver
+    
     def scrape_from_url(self, url, description=""):
         """Scrape events directly from a given URL - WITH PAGINATION SUPPORT"""
         self.logger.info(f"\n🎯 Scraping from URL: {description}")
         self.logger.info(f"🔗 URL: {url}")
         
         all_event_links = []
-        current_page = 1
+        # Start from the page the URL points at - a cp=3 link means pages 1-2 are skipped
+        first_page = current_page = page_number_of(url)
+        page_url = url
         
         try:
-            # Navigate directly to the URL
-            self.logger.info("🌐 Loading initial page...")
-            self.driver.get(url)
-            time.sleep(5)
-            
-            self.logger.info("✅ Initial page loaded successfully!")
-            
             # Scrape all pages with pagination
             while True:
+                if self.stop_requested.is_set():
+                    self.logger.warning(f"⏹️  Stop requested - abandoning {description}")
+                    return 0
+                
                 self.logger.info(f"\n📄 Scraping page {current_page}...")
                 
                 # Extract events from current page
-                page_events = self.get_event_links_from_current_page()
+                page_events, doc = self.get_event_links_from_current_page(page_url)
                 
                 if page_events:
                     self.logger.info(f"✅ Found {len(page_events)} events from SECOND Stable table on page {current_page}")
                     # Show first few events from this page
-                    self.logger.debug("   📋 Sample events from SECOND Stable table:")
-                    for i, event in enumerate(page_events[:3]):
-                        self.logger.debug(f"      {i+1}. {event['name']}")
-                    if len(page_events) > 3:
-                        self.logger.debug(f"      ... and {len(page_events) - 3} more events")
+                    if self.logger.isEnabledFor(logging.DEBUG):
+                        self.logger.debug("   📋 Sample events from SECOND Stable table:")
+                        for i, event in enumerate(page_events[:3]):
+                            self.logger.debug("      %s. %s", i+1, event['name'])
+                        if len(page_events) > 3:
+                            self.logger.debug("      ... and %s more events", len(page_events) - 3)
                     
                     all_event_links.extend(page_events)
                 else:
                     self.logger.warning(f"⚠️  No events found in SECOND Stable table on page {current_page}")
                     self.logger.debug("   🚫 STRICT MODE: Page skipped (need 2 Stable tables, using second one only)")
-                    
-                    # Debug what's actually on this page
+                
+                if doc is None:
+                    self.logger.info(f"🏁 Could not load page {current_page}. Scraped {current_page - first_page} page(s) total.")
+                    break
+                
+                # Debug what's actually on this page - only worth the queries at DEBUG level
+                if not page_events and self.logger.isEnabledFor(logging.DEBUG):
                     self.logger.debug("   🔍 DEBUG: Checking page structure...")
-                    stable_tables = self.driver.find_elements(By.CSS_SELECTOR, "table.Stable")
-                    all_tables = self.driver.find_elements(By.TAG_NAME, "table")
-                    self.logger.debug(f"      Total tables on page: {len(all_tables)}")
-                    self.logger.debug(f"      Tables with class='Stable': {len(stable_tables)}")
+                    stable_tables = _STABLE_TABLES(doc)
+                    all_tables = list(doc.iter('table'))
+                    self.logger.debug("      Total tables on page: %s", len(all_tables))
+                    self.logger.debug("      Tables with class='Stable': %s", len(stable_tables))
                     
                     # Check page title and URL for context
-                    page_title = self.driver.title
-                    current_url = self.driver.current_url
-                    self.logger.debug(f"      Page title: {page_title}")
-                    self.logger.debug(f"      Current URL: {current_url}")
+                    page_title = (doc.findtext('.//title') or "").strip()
+                    self.logger.debug("      Page title: %s", page_title)
+                    self.logger.debug("      Current URL: %s", page_url)
                     
                     # Show details about Stable tables found
                     if stable_tables:
-                        self.logger.debug(f"      Stable tables analysis:")
+                        self.logger.debug("      Stable tables analysis:")
                         for i, table in enumerate(stable_tables, 1):
-                            all_links_in_table = table.find_elements(By.TAG_NAME, "a")
-                            event_links_in_table = table.find_elements(By.CSS_SELECTOR, "a[href*='event?e=']")
+                            all_links_in_table = list(table.iter('a'))
+                            event_links_in_table = _EVENT_LINKS(table)
                             status = "(USED)" if i == 2 else "(IGNORED)"
-                            self.logger.debug(f"         Stable table #{i} {status}: {len(all_links_in_table)} total links, {len(event_links_in_table)} event links")
-
-                # Look for "Next" button or next page number
-                has_next_page = False
-                
-                self.logger.debug(f"🔍 Looking for pagination options on page {current_page}...")
-                
-                try:
-                    # Method 1: Look for "Next" link - IMPROVED to look in Nav_norm divs
-                    self.logger.debug("   📍 Method 1: Looking for 'Next' button in Nav_norm divs...")
-                    
-                    # First, find all Nav_norm divs
-                    nav_divs = self.driver.find_elements(By.CSS_SELECTOR, "div.Nav_norm")
-                    self.logger.debug(f"      Found {len(nav_divs)} div(s) with class='Nav_norm'")
-                    
-                    # Look for Next link in the LAST Nav_norm div (as you observed)
-                    next_link = None
-                    if nav_divs:
-                        last_nav_div = nav_divs[-1]  # Get the last Nav_norm div
-                        self.logger.debug(f"      Checking LAST Nav_norm div for 'Next' link...")
-                        
-                        # Look for Next link within this last Nav_norm div
-                        next_links_in_div = last_nav_div.find_elements(By.XPATH, ".//a[contains(text(), 'Next') or contains(text(), 'next') or contains(text(), 'NEXT')]")
-                        
-                        if next_links_in_div:
-                            next_link = next_links_in_div[0]
-                            self.logger.debug(f"      Found 'Next' link in LAST Nav_norm div")
-                        else:
-                            self.logger.debug(f"      No 'Next' link found in LAST Nav_norm div")
-                            # Debug: show what's actually in the last Nav_norm div
-                            div_text = last_nav_div.text.strip()
-                            self.logger.debug(f"      Last Nav_norm div content: '{div_text}'")
-                    
-                    if next_link:
-                        next_class = next_link.get_attribute('class') or ""
-                        next_href = next_link.get_attribute('href') or ""
-                        self.logger.debug(f"      Next link text: '{next_link.text}', class: '{next_class}', enabled: {next_link.is_enabled()}")
-                        self.logger.debug(f"      Next link URL: {next_href}")
-                        
-                        # Check for Nav_PN_no class - indicates no next page
-                        if 'Nav_PN_no' in next_class:
-                            self.logger.debug("      ❌ Next button has 'Nav_PN_no' class - no more pages available")
-                        elif next_link.is_enabled():
-                            self.logger.info(f"🔗 Clicking 'Next' button to go to page {current_page + 1}")
-                            self.logger.info(f"   📍 Next button href URL: {next_href}")
-                            self.driver.execute_script("arguments[0].click();", next_link)
-                            time.sleep(4)
-                            # Show actual URL after navigation
-                            actual_url = self.driver.current_url
-                            self.logger.info(f"   🎯 Actual navigated URL: {actual_url}")
-                            has_next_page = True
-                    else:
-                        self.logger.debug("      No 'Next' link found in any Nav_norm div")
-                    
-                    # Method 2: If no "Next" button, try numbered pagination
-                    if not has_next_page:
-                        self.logger.debug("   📍 Method 2: Looking for numbered page links...")
-                        next_page_num = current_page + 1
-                        
-                        # IMPROVED: More precise selectors to avoid false positives
-                        page_selectors = [
-                            # Look for exact number match that is the entire text content
-                            f"//a[normalize-space(text())='{next_page_num}']",
-                            # Look for links with cp= parameter in href
-                            f"//a[contains(@href, 'cp={next_page_num}')]",
-                            # Look for number in href parameter (most reliable)
-                            f"//a[contains(@href, '&cp={next_page_num}') or contains(@href, '?cp={next_page_num}')]"
-                        ]
-                        
-                        page_link_found = False
-                        for i, selector in enumerate(page_selectors, 1):
-                            page_links = self.driver.find_elements(By.XPATH, selector)
-                            self.logger.debug(f"      Selector {i} '{selector}': found {len(page_links)} links")
-                            
-                            if page_links:
-                                # Additional validation: make sure it's actually a pagination link
-                                for page_link in page_links:
-                                    link_text = page_link.text.strip()
-                                    link_href = page_link.get_attribute('href') or ""
-                                    link_class = page_link.get_attribute('class') or ""
-                                    
-                                    # FILTER 1: Skip if it has Nav_PN_no class (disabled pagination)
-                                    if 'Nav_PN_no' in link_class:
-                                        self.logger.debug(f"      Skipping disabled pagination link (Nav_PN_no): '{link_text}' → {link_href}")
-                                        continue
-                                    
-                                    # Skip if it's clearly not a pagination link
-                                    if ('archetype' in link_href or 
-                                        'aggro' in link_text.lower() or
-                                        'control' in link_text.lower() or
-                                        'combo' in link_text.lower() or
-                                        len(link_text) > 3):  # Page numbers should be short
-                                        self.logger.debug(f"      Skipping non-pagination link: '{link_text}' → {link_href}")
-                                        continue
-                                    
-                                    # This looks like a real pagination link
-                                    self.logger.debug(f"      Valid page link found: '{link_text}' → {link_href}")
-                                    self.logger.info(f"🔗 Clicking page {next_page_num} link...")
-                                    self.logger.info(f"   📍 Page link href URL: {link_href}")
-                                    self.driver.execute_script("arguments[0].click();", page_link)
-                                    time.sleep(4)
-                                    # Show actual URL after navigation
-                                    actual_url = self.driver.current_url
-                                    self.logger.info(f"   🎯 Actual navigated URL: {actual_url}")
-                                    has_next_page = True
-                                    page_link_found = True
-                                    break
-                            
-                            if page_link_found:
-                                break
-                        
-                        if not page_link_found:
-                            self.logger.debug(f"      No valid page {next_page_num} link found")
-                    
-                    # Debug: Show all links on current page for troubleshooting
-                    if not has_next_page:
-                        self.logger.debug("   🔍 DEBUG: Showing potential pagination links:")
-                        all_links = self.driver.find_elements(By.TAG_NAME, "a")
-                        pagination_links = []
-                        
-                        for link in all_links:
-                            href = link.get_attribute('href') or ""
-                            text = link.text.strip()
-                            link_class = link.get_attribute('class') or ""
-                            
-                            # Look for potential pagination links - IMPROVED FILTERING
-                            is_pagination = False
-                            
-                            # Skip disabled pagination links first
-                            if 'Nav_PN_no' in link_class:
-                                continue
-                            
-                            # Check for explicit pagination patterns
-                            if ('cp=' in href and 
-                                'archetype' not in href and 
-                                'event' not in href):
-                                is_pagination = True
-                            elif (text.lower() in ['next', 'prev', 'previous'] or
-                                  (text.isdigit() and len(text) <= 2 and 
-                                   'aggro' not in href.lower() and 
-                                   'control' not in href.lower())):
-                                is_pagination = True
-                            
-                            if is_pagination:
-                                class_info = f" (class='{link_class}')" if link_class else ""
-                                pagination_links.append(f"Text: '{text}' → {href}{class_info}")
-                        
-                        self.logger.debug(f"      Found {len(pagination_links)} potential pagination links:")
-                        for i, link in enumerate(pagination_links[:10]):  # Show first 10
-                            self.logger.debug(f"         {i+1}. {link}")
-                        
-                        if not pagination_links:
-                            self.logger.debug("      No valid pagination links found - this might be the last page")
-                except Exception as e:
-                    self.logger.error(f"⚠️  Error checking for next page: {e}")
-                    import traceback
-                    self.logger.debug(traceback.format_exc())
+                            self.logger.debug("         Stable table #%s %s: %s total links, %s event links", i, status, len(all_links_in_table), len(event_links_in_table))
 
-                if not has_next_page:
-                    self.logger.info(f"🏁 No more pages found. Scraped {current_page} page(s) total.")
+                # MTGTop8 paginates with a plain cp=N query parameter - step it directly
+                self.logger.debug("🔍 Looking for pagination options on page %s...", current_page)
+                if not self.has_next_page(doc):
+                    self.logger.info(f"🏁 No more pages found. Scraped {current_page - first_page + 1} page(s) total.")
                     break
                 
                 current_page += 1
+                page_url = page_url_for(url, current_page)
+                self.logger.info(f"🔗 Going to page {current_page}: {page_url}")
                 
                 # Safety limit to prevent infinite loops - INCREASED for large datasets
-                if current_page > 5000:
+                if current_page - first_page >= 5000:
                     self.logger.warning("⚠️  Reached safety limit of 5000 pages")
                     break
             
             # Remove duplicates from all pages - OPTIMIZED for large datasets
             self.logger.info(f"🔄 Removing duplicates from {len(all_event_links)} total events...")
-            unique_events = []
-            seen_urls = set()
-            
-            for i, event in enumerate(all_event_links):
-                if event['url'] not in seen_urls:
-                    unique_events.append(event)
-                    seen_urls.add(event['url'])
-                
-                # Progress indicator for large datasets
-                if i > 0 and i % 1000 == 0:
-                    self.logger.debug(f"   Processed {i:,} events for deduplication...")
+            # Single dict build keyed by URL - keeps first-seen order
+            unique_events = list({event['url']: event for event in all_event_links}.values())
             
             self.logger.info(f"\n📊 PAGINATION SUMMARY (STRICT MODE - SECOND Stable table only):")
-            self.logger.info(f"   • Pages scraped: {current_page}")
+            self.logger.info(f"   • Pages scraped: {current_page - first_page + 1}")
             self.logger.info(f"   • Total events found: {len(all_event_links):,} (from SECOND Stable table only)")
             self.logger.info(f"   • Unique events: {len(unique_events):,}")
             self.logger.info(f"   • Duplicates removed: {len(all_event_links) - len(unique_events):,}")
@@ -337,244 +687,652 @@ class MTGTop8URLScraper:
             total_events = len(events_to_process)
             if total_events > 1000:
                 self.logger.info(f"🕐 Large dataset detected ({total_events:,} events)")
-                self.logger.info(f"⏱️  Estimated time: {(total_events * 6) / 60:.1f} minutes")
             
-            events_processed = 0
-            for i, event in enumerate(events_to_process, 1):
-                # Progress reporting for large datasets
-                if total_events > 100 and i % 50 == 0:
-                    progress = (i / total_events) * 100
-                    self.logger.info(f"📊 Progress: {i:,}/{total_events:,} events ({progress:.1f}%)")
-                
-                self.logger.info(f"\n--- Event {i:,}/{len(events_to_process):,} ---")
-                
-                event_data = self.extract_event_data(event['url'], event['name'])
-                
-                if event_data:
-                    self.all_events_data.append(event_data)
-                    events_processed += 1
-                    self.logger.info(f"✅ Event {i:,} completed successfully")
-                else:
-                    self.logger.warning(f"❌ Event {i:,} failed")
-                    
-                # Be respectful to the server - adjust delay for large datasets
-                if i < len(events_to_process):
-                    if total_events > 10000:
-                        # Shorter delay for very large datasets to reduce total time
-                        self.logger.debug("⏳ Waiting 2 seconds...")
-                        time.sleep(2)
-                    else:
-                        self.logger.debug("⏳ Waiting 3 seconds...")
-                        time.sleep(3)
+            # Fetch event pages concurrently on one event loop
+            events_processed = asyncio.run(self.gather_events(events_to_process, description))
             
             return events_processed
             
         except Exception as e:
             self.logger.error(f"❌ Error scraping URL: {e}")
-            self.logger.debug(traceback.format_exc())
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(traceback.format_exc())
             return 0
             
-    def get_event_links_from_current_page(self):
-        """Get event links from the current page only - STRICT: ONLY from SECOND table.Stable"""
-        event_links = []
+    def has_next_page(self, doc):
+        """Check whether a list page has a page after it"""
+        nav_divs = _NAV_DIVS(doc)
+        if not nav_divs:
+            self.logger.debug("      No Nav_norm div found - single page")
+            return False
+        
+        next_links = _NEXT_LINK(nav_divs[-1])
+        if not next_links:
+            self.logger.debug("      No 'Next' link in the last Nav_norm div - this is the last page")
+            return False
+        
+        # MTGTop8 marks the last page's Next link with Nav_PN_no - that one check is authoritative
+        if _DISABLED_PAGE_CLASS in link_classes(next_links[0]):
+            self.logger.debug("      ❌ Next link has 'Nav_PN_no' class - no more pages available")
+            return False
+        
+        return True
+    
+    async def gather_events(self, events, label=""):
+        """Process every event page concurrently over one aiohttp session and return how many succeeded"""
+        total_events = len(events)
         
+        # Only EVENT_CONCURRENCY tasks per loop compete for the shared request slots
+        semaphore = asyncio.Semaphore(EVENT_CONCURRENCY)
+        connector = aiohttp.TCPConnector(limit=EVENT_CONCURRENCY)
+        timeout = aiohttp.ClientTimeout(total=30)
+        events_processed = 0
+        
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout,
+                                         headers={'User-Agent': USER_AGENT}) as http:
+            tasks = [
+                asyncio.create_task(self.fetch_event(http, semaphore, i, event, total_events, label))
+                for i, event in enumerate(events, 1)
+            ]
+            
+            for completed, task in enumerate(asyncio.as_completed(tasks), 1):
+                if self.stop_requested.is_set():
+                    self.logger.warning(f"⏹️  [{label}] Stop requested - abandoning {total_events - completed + 1:,} remaining events")
+                    # `task` is an as_completed() waiter coroutine - close it rather than leave it unawaited
+                    task.close()
+                    for pending_task in tasks:
+                        pending_task.cancel()
+                    break
+                
+                i, event_data = await task
+                
+                if event_data:
+                    self.write_event(event_data)
+                    events_processed += 1
+                    self.logger.info(f"✅ [{label}] Event {i:,} completed successfully")
+                else:
+                    self.logger.warning(f"❌ [{label}] Event {i:,} failed")
+                
+                # Progress reporting for large datasets
+                if total_events > 100 and completed % 50 == 0:
+                    progress = (completed / total_events) * 100
+                    self.logger.info(f"📊 [{label}] Progress: {completed:,}/{total_events:,} events ({progress:.1f}%)")
+            
+            # Collect cancelled tasks while the session they use is still open
+            await asyncio.gather(*tasks, return_exceptions=True)
+        
+        return events_processed
+    
+    async def fetch_event(self, http, semaphore, index, event, total_events, label=""):
+        """Process one event - at most EVENT_CONCURRENCY per event loop at a time"""
+        async with semaphore:
+            self.logger.info(f"\n--- [{label}] Event {index:,}/{total_events:,} ---")
+            event_data = await self.extract_event_data(http, event['url'], event['name'])
+        
+        return index, event_data
+    
+    @asynccontextmanager
+    async def request_slot(self):
+        """Hold one of the process-wide request slots for a trip to mtgtop8.com"""
+        async with self.request_slots:
+            try:
+                yield
+            finally:
+                # Be respectful to the server - a short pause before releasing the slot
+                await asyncio.sleep(EVENT_REQUEST_DELAY)
+    
+    def fetch_document(self, url, ready_selector):
+        """Fetch a page over HTTP as an lxml document, falling back to Chrome if it lacks `ready_selector`"""
+        for attempt in range(RATE_LIMIT_RETRIES + 1):
+            response = self.session.get(url, timeout=30)
+            if response.status_code != 429 or attempt == RATE_LIMIT_RETRIES:
+                break
+            delay = retry_delay(response.headers, attempt)
+            self.logger.warning(f"⏳ Rate limited on {url} - retrying in {delay}s")
+            time.sleep(delay)
+        # Network failures and error statuses raise - a browser wouldn't get a better answer
+        response.raise_for_status()
+        
+        doc = self._parse_if_ready(response.content, response.url, ready_selector)
+        if doc is not None:
+            return doc
+        
+        # Rendered by JavaScript - child scrapers borrow a browser from the pool
+        if self.parent is None:
+            return self._load_with_driver(self.get_driver(), url, ready_selector)
+        return self._load_with_pool(url, ready_selector)
+    
+    def _parse_if_ready(self, content, url, ready_selector):
+        """Parse an HTTP response body, or return None if it lacks `ready_selector`"""
+        doc = lxml.html.fromstring(content, base_url=url)
+        if ready_selector(doc):
+            doc.make_links_absolute(url)
+            return doc
+        self.logger.debug("No '%s' in HTTP response for %s - falling back to Selenium", ready_selector.css, url)
+        return None
+    
+    def _load_with_pool(self, url, ready_selector):
+        """Load a page on a driver borrowed from the driver pool"""
+        with self.driver_pool.checkout() as pooled_driver:
+            return self._load_with_driver(pooled_driver, url, ready_selector)
+    
+    def _load_with_driver(self, driver, url, ready_selector):
+        """Load a page in Chrome, wait for `ready_selector` and parse the rendered HTML"""
+        driver.get(url)
         try:
-            # Scroll to make sure page is fully loaded
-            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(1)
+            WebDriverWait(driver, PAGE_READY_TIMEOUT).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, ready_selector.css))
+            )
+        except TimeoutException:
+            # Parse whatever rendered - callers decide what a missing element means
+            self.logger.debug("'%s' did not appear within %ss on %s", ready_selector.css, PAGE_READY_TIMEOUT, url)
+        
+        # One round-trip for both the rendered HTML and the final URL - every
+        # query after this runs in-process against the lxml tree
+        html, current_url = driver.execute_script(
+            "return [document.documentElement.outerHTML, window.location.href];"
+        )
+        doc = lxml.html.fromstring(html, base_url=current_url)
+        doc.make_links_absolute(current_url)
+        return doc
             
+    def get_event_links_from_current_page(self, url):
+        """Get (event links, parsed page) from a list page - STRICT: ONLY from SECOND table.Stable"""
+        event_links = []
+        
+        try:
+            with self.request_slots:
+                doc = self.fetch_document(url, _STABLE_TABLES)
+        except Exception as e:
+            self.logger.error(f"❌ Error loading page: {e}")
+            return [], None
+        
+        try:
             # Look for events ONLY in the SECOND table with class="Stable"
-            stable_tables = self.driver.find_elements(By.CSS_SELECTOR, "table.Stable")
-            self.logger.debug(f"Found {len(stable_tables)} table(s) with class='Stable'")
+            stable_tables = _STABLE_TABLES(doc)
+            self.logger.debug("Found %s table(s) with class='Stable'", len(stable_tables))
             
             if len(stable_tables) < 2:
                 self.logger.warning(f"⚠️  Expected 2 Stable tables, found {len(stable_tables)} - SKIPPING PAGE")
                 self.logger.debug("   🚫 STRICT MODE: Need exactly 2 Stable tables to get data from second one")
-                return []  # Return empty list - skip this page entirely
+                return [], doc  # Return empty list - skip this page entirely
             
             # Get events from ONLY the second Stable table (index 1)
             second_table = stable_tables[1]
-            event_elements = second_table.find_elements(By.CSS_SELECTOR, "a[href*='event?e=']")
-            self.logger.debug(f"   Found {len(event_elements)} event links in SECOND Stable table")
+            event_elements = _EVENT_LINKS(second_table)
+            self.logger.debug("   Found %s event links in SECOND Stable table", len(event_elements))
             
             # Debug: Show what's in first table vs second table
-            first_table_events = stable_tables[0].find_elements(By.CSS_SELECTOR, "a[href*='event?e=']")
-            self.logger.debug(f"   First Stable table has {len(first_table_events)} event links (IGNORED)")
-            self.logger.debug(f"   Second Stable table has {len(event_elements)} event links (USED)")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                first_table_events = _EVENT_LINKS(stable_tables[0])
+                self.logger.debug("   First Stable table has %s event links (IGNORED)", len(first_table_events))
+                self.logger.debug("   Second Stable table has %s event links (USED)", len(event_elements))
             
             filtered_count = 0
             for element in event_elements:
-                try:
-                    event_text = element.text.strip()
-                    event_url = element.get_attribute('href')
-                    element_class = element.get_attribute('class') or ""
+                event_text = element.text_content().strip()
+                event_url = element.get('href')
+                
+                # Skip empty or invalid links
+                if not event_text or not event_url:
+                    continue
                     
-                    # Skip empty or invalid links
-                    if not event_text or not event_url:
-                        continue
-                        
-                    # FILTER 1: Skip events with class="und"
-                    if 'und' in element_class:
-                        self.logger.debug(f"Skipping event with class='und': {event_text}")
-                        filtered_count += 1
-                        continue
-                        
-                    # FILTER 2: Skip League events (case insensitive)
-                    if 'league' in event_text.lower():
-                        self.logger.debug(f"Skipping League event: {event_text}")
-                        filtered_count += 1
-                        continue
-                        
-                    # Add to list (duplicates will be removed later)
-                    event_links.append({
-                        'name': event_text,
-                        'url': event_url
-                    })
-                        
-                except Exception as e:
+                # FILTER 1: Skip events with class="und"
+                if not _SKIP_EVENT_CLASSES.isdisjoint(link_classes(element)):
+                    self.logger.debug("Skipping event with class='und': %s", event_text)
+                    filtered_count += 1
+                    continue
+                    
+                # FILTER 2: Skip League events (case insensitive)
+                if 'league' in event_text.lower():
+                    self.logger.debug("Skipping League event: %s", event_text)
+                    filtered_count += 1
                     continue
+                    
+                # Add to list (duplicates will be removed later)
+                event_links.append({
+                    'name': event_text,
+                    'url': event_url
+                })
             
-            self.logger.debug(f"Filtered out {filtered_count} events (und class + league events)")
-            self.logger.debug(f"Remaining valid events from SECOND Stable table: {len(event_links)}")
+            self.logger.debug("Filtered out %s events (und class + league events)", filtered_count)
+            self.logger.debug("Remaining valid events from SECOND Stable table: %s", len(event_links))
             
-            return event_links
+            return event_links, doc
             
         except Exception as e:
             self.logger.error(f"❌ Error getting events from SECOND Stable table: {e}")
-            return []
+            return [], doc
             
-    def extract_event_data(self, event_url, event_name):
+    async def download(self, http, url):
+        """GET a page over aiohttp, backing off on HTTP 429 - returns (content, final_url)"""
+        for attempt in range(RATE_LIMIT_RETRIES + 1):
+            async with http.get(url) as response:
+                if response.status != 429 or attempt == RATE_LIMIT_RETRIES:
+                    # Error statuses, and a 429 after the last retry, raise aiohttp.ClientResponseError
+                    response.raise_for_status()
+                    return await response.read(), str(response.url)
+                delay = retry_delay(response.headers, attempt)
+            self.logger.warning(f"⏳ Rate limited on {url} - retrying in {delay}s")
+            await asyncio.sleep(delay)
+    
+    async def extract_event_data(self, http, event_url, event_name):
         """Extract data from individual event"""
-        self.logger.info(f"📊 Processing: {event_name[:50]}...")
+        self.logger.info("📊 Processing: %s...", event_name[:50])
         
         try:
-            # Navigate to event page
-            self.driver.get(event_url)
-            time.sleep(3)
+            loop = asyncio.get_running_loop()
             
-            # Extract date
-            date = "Unknown"
-            try:
-                page_source = self.driver.page_source
-                date_match = re.search(r'\d{2}/\d{2}/\d{2}', page_source)
-                if date_match:
-                    date = date_match.group()
-            except:
-                pass
-            
-            # Extract deck information
-            decks = []
-            try:
-                # Look for deck links in the page
-                deck_links = self.driver.find_elements(By.CSS_SELECTOR, "a[href*='&d=']")
+            # Serve the event page from the cache when we already have it - no
+            # request slot or politeness delay for pages that never touch the network
+            event_data = None
+            cached = self.cache.get(event_url)
+            if cached is not None:
+                content, final_url = cached
+                event_data = await loop.run_in_executor(
+                    self.parse_pool, parse_event_html, content, final_url, event_url, event_name
+                )
+            
+            # Otherwise fetch it over HTTP and parse it in a worker process. Error
+            # statuses are skipped - a browser would only add load to a struggling server
+            if event_data is None:
+                try:
+                    async with self.request_slot():
+                        content, final_url = await self.download(http, event_url)
+                except aiohttp.ClientResponseError as e:
+                    self.logger.warning(f"⚠️  HTTP {e.status} for {event_url} - skipping event")
+                    return None
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    self.logger.warning(f"⚠️  HTTP fetch failed for {event_url}: {e} - skipping event")
+                    return None
                 
-                position_counter = 1
-                for link in deck_links:
-                    try:
-                        deck_name = link.text.strip()
-                        deck_url = link.get_attribute('href')
-                        
-                        if deck_name and deck_url and '&d=' in deck_url:
-                            decks.append({
-                                'position': position_counter,
-                                'deck_name': deck_name,
-                                'player': 'Unknown',  # Can be improved later
-                                'deck_url': deck_url
-                            })
-                            position_counter += 1
-                            
-                    except:
-                        continue
-                        
-            except Exception as e:
-                self.logger.warning(f"⚠️  Could not extract all deck data: {e}")
+                event_data = await loop.run_in_executor(
+                    self.parse_pool, parse_event_html, content, final_url, event_url, event_name
+                )
+                if event_data is None:
+                    self.logger.debug("No deck links in HTTP response for %s - falling back to Selenium", event_url)
+                else:
+                    self.cache.put(event_url, content, final_url)
             
-            event_data = {
-                'event_name': event_name,
-                'date': date,
-                'event_url': event_url,
-                'total_decks': len(decks),
-                'decks': decks
-            }
+            # Pages rendered by JavaScript go to a pooled browser, off the event loop
+            if event_data is None:
+                async with self.request_slot():
+                    doc = await loop.run_in_executor(None, self._load_with_pool, event_url, _DECK_LINKS)
+                event_data = parse_event_document(doc, event_url, event_name)
+                if event_data['total_decks']:
+                    self.cache.put(event_url, lxml.html.tostring(doc), doc.base_url or event_url)
             
-            self.logger.info(f"✅ Extracted {len(decks)} decks")
+            self.logger.info("✅ Extracted %s decks", event_data['total_decks'])
             return event_data
             
         except Exception as e:
             self.logger.error(f"❌ Error processing event: {e}")
             return None
-            
+    
+    def write_event(self, event_data):
+        """Stream one event's decks into the shared CSV"""
+        self.output.write_event(event_data)
+    
     def save_data(self):
-        """Save all extracted data to CSV file only - OPTIMIZED for large datasets"""
-        if not self.all_events_data:
+        """Finish the CSV file - rows are already written as each event completes"""
+        output = self.output
+        output.close()
+        
+        if not output.events_saved:
             self.logger.warning("❌ No data to save")
             return
-            
-        self.logger.info(f"\n💾 Saving data from {len(self.all_events_data):,} events...")
-        
-        # Create flat list for CSV - with progress tracking for large datasets
-        all_decks = []
-        total_events = len(self.all_events_data)
-        
-        for event_idx, event in enumerate(self.all_events_data):
-            # Progress indicator for large datasets
-            if total_events > 1000 and event_idx % 500 == 0 and event_idx > 0:
-                self.logger.debug(f"   Processing event {event_idx:,}/{total_events:,} for CSV...")
-            
-            for deck in event['decks']:
-                all_decks.append({
-                    'event_name': event['event_name'],
-                    'event_date': event['date'],
-                    'event_url': event['event_url'],
-                    'deck_position': deck['position'],
-                    'deck_name': deck['deck_name'],
-                    'player_name': deck['player'],
-                    'deck_url': deck['deck_url']
-                })
         
-        # Save to CSV (Excel-friendly) with chunking for very large datasets
-        if all_decks:
-            self.logger.info(f"💾 Writing {len(all_decks):,} decks to CSV...")
-            
-            df = pd.DataFrame(all_decks)
-            csv_filename = 'mtgtop8_decks.csv'
-            
-            # For very large datasets, use chunking to avoid memory issues
-            if len(all_decks) > 100000:
-                self.logger.info("🔄 Large dataset detected - using chunked CSV writing...")
-                chunk_size = 10000
-                for i in range(0, len(df), chunk_size):
-                    chunk = df[i:i+chunk_size]
-                    if i == 0:
-                        chunk.to_csv(csv_filename, index=False, mode='w', header=True)
-                    else:
-                        chunk.to_csv(csv_filename, index=False, mode='a', header=False)
-                    self.logger.debug(f"   Written chunk {i//chunk_size + 1} ({i+len(chunk):,}/{len(df):,} rows)")
-            else:
-                df.to_csv(csv_filename, index=False)
-            
-            self.logger.info(f"✅ Deck data saved to '{csv_filename}'")
-            self.logger.info(f"📊 Total decks extracted: {len(all_decks):,}")
+        self.logger.info(f"✅ Deck data saved to '{output.filename}'")
+        self.logger.info(f"📊 Total decks extracted: {output.decks_saved:,}")
         
         # Print summary with better formatting for large numbers
         self.logger.info(f"\n📈 EXTRACTION SUMMARY:")
-        self.logger.info(f"   • Total Events: {len(self.all_events_data):,}")
-        self.logger.info(f"   • Total Decks: {len(all_decks):,}")
-        self.logger.info(f"   • File Created: {csv_filename}")
+        self.logger.info(f"   • Total Events: {output.events_saved:,}")
+        self.logger.info(f"   • Total Decks: {output.decks_saved:,}")
+        self.logger.info(f"   • File Created: {output.filename}")
         
-        # Memory usage info for large datasets
-        if len(all_decks) > 50000:
-            file_size_mb = sum(len(str(deck)) for deck in all_decks) / (1024 * 1024)
-            self.logger.info(f"   • Estimated file size: {file_size_mb:.1f} MB")
+        # File size info for large datasets
+        if output.decks_saved > 50000:
+            file_size_mb = os.path.getsize(output.filename) / (1024 * 1024)
+            self.logger.info(f"   • File size: {file_size_mb:.1f} MB")
         
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        self.close()
+        return False
+    
     def close(self):
-        """Close the browser"""
+        """Close the HTTP session, the CSV file, the parse workers, the browser and the driver pool"""
+        # The shared resources belong to the parent - a child leaves them alone
+        if self.parent is None:
+            if hasattr(self, 'output'):
+                self._close_resource("CSV file", self.output.close)
+            if hasattr(self, 'parse_pool'):
+                self._close_resource("parse workers",
+                                     lambda: self.parse_pool.shutdown(wait=False, cancel_futures=True))
+            if hasattr(self, 'driver_pool'):
+                self._close_resource("driver pool", self.driver_pool.close)
+            if hasattr(self, 'cache'):
+                self._close_resource("page cache", self.cache.close)
+        # Every scraper, parent or child, has its own HTTP session
+        self._close_resource("HTTP session", self.session.close)
+        if getattr(self, 'driver', None) is None:
+            return
+        self._close_resource("browser", self._quit_driver)
+    
+    def _close_resource(self, name, close):
+        """Run one cleanup step, logging a failure instead of skipping the rest"""
         try:
-            self.driver.quit()
+            close()
+        except Exception as e:
+            self.logger.error(f"❌ Error closing {name}: {e}")
+    
+    def _quit_driver(self):
+        if quit_driver(self.driver):
             self.logger.info("🏁 Browser closed successfully")
-        except:
+        else:
             self.logger.info("🏁 Browser was already closed")
 
+def scrape_one_url(scraper, i, total, url, description):
+    """Scrape one command line URL - runs in a main() worker thread"""
+    logger = scraper.logger
+    logger.info("\n%s", SEP)
+    logger.info("📄 URL %s/%s: %s", i, total, description)
+    logger.info(SEP)
+    
+    logger.debug("Starting to process URL: %s", url)
+    
+    # ChromeDriver sessions aren't thread-safe - only the first URL uses the main
+    # scraper's browser, the rest borrow pooled ones one page at a time
+    if i == 1:
+        return scraper.scrape_from_url(url, description)
+    with MTGTop8URLScraper(parent=scraper) as child:
+        return child.scrape_from_url(url, description)
+
+def scrape_urls(scraper, urls_to_scrape, logger):
+    """Scrape every command line URL, several side by side, and return the events processed"""
+    total_urls = len(urls_to_scrape)
+    jobs = enumerate(((u['url'], u['description']) for u in urls_to_scrape), 1)
+    if total_urls == 1:
+        i, (url, description) = next(jobs)
+        events_processed = scrape_one_url(scraper, i, total_urls, url, description)
+        logger.info(f"\n✅ URL {i} completed: {events_processed} events processed")
+        return events_processed
+    
+    total_events_processed = 0
+    pending = set()
+    executor = ThreadPoolExecutor(max_workers=min(total_urls, URL_WORKERS))
+    try:
+        futures = {
+            executor.submit(scrape_one_url, scraper, i, total_urls, url, description): i
+            for i, (url, description) in jobs
+        }
+        pending = set(futures)
+        while pending:
+            # Wake up regularly - a wait with no timeout can't be interrupted by Ctrl+C on Windows
+            done, pending = wait(pending, timeout=1, return_when=FIRST_COMPLETED)
+            for future in done:
+                i = futures[future]
+                try:
+                    events_processed = future.result()
+                except Exception as e:
+                    logger.error(f"❌ URL {i} failed: {e}")
+                    continue
+                total_events_processed += events_processed
+                
+                logger.info(f"\n✅ URL {i} completed: {events_processed} events processed")
+                logger.debug("Total events processed so far: %d", total_events_processed)
+    finally:
+        if pending:
+            scraper.stop_requested.set()
+            for future in pending:
+                future.cancel()
+            logger.info(f"⏹️  Waiting up to {URL_STOP_TIMEOUT}s for running URLs to stop...")
+            deadline = time.perf_counter() + URL_STOP_TIMEOUT
+            while pending and time.perf_counter() < deadline:
+                # Short waits again so a second Ctrl+C still gets through on Windows
+                _, pending = wait(pending, timeout=1)
+            if pending:
+                logger.warning(f"⚠️  {len(pending)} URL(s) still running - cleaning up anyway")
+        executor.shutdown(wait=False, cancel_futures=True)
+    return total_events_processed
+
+def write_server_key(key):
+    """Publish a --serve authkey in a new file that only the current user can read"""
+    try:
+        os.remove(SERVER_KEY_PATH)
+    except FileNotFoundError:
+        pass
+    fd = os.open(SERVER_KEY_PATH, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    with os.fdopen(fd, 'wb') as key_file:
+        key_file.write(key)
+
+def read_server_key():
+    """Return the authkey written by a --serve instance, or None if there isn't one"""
+    try:
+        with open(SERVER_KEY_PATH, 'rb') as key_file:
+            return key_file.read() or None
+    except OSError:
+        return None
+
+def serve(scraper, logger):
+    """Keep one scraper and its browser warm and run URL jobs from later invocations until Ctrl+C"""
+    # Start Chrome up front, so no job pays for the cold start
+    scraper.get_driver()
+    key = secrets.token_hex(32).encode()
+    with socket.create_server(SERVER_ADDRESS) as listener:
+        # Wake up regularly - a blocking accept() can't be interrupted by Ctrl+C on Windows
+        listener.settimeout(1)
+        write_server_key(key)
+        logger.info(f"🖥️  Serving on {SERVER_ADDRESS[0]}:{SERVER_ADDRESS[1]} - press Ctrl+C to stop")
+        logger.info(f"🔑 Clients authenticate with the key in {SERVER_KEY_PATH}")
+        logger.info(f"💾 Rows from every job are written to {os.path.abspath(scraper.output.filename)}")
+        while True:
+            try:
+                conn = accept_client(listener, key)
+            except socket.timeout:
+                continue
+            except (AuthenticationError, OSError, EOFError) as e:
+                logger.warning(f"⚠️  Rejected client connection: {e}")
+                continue
+            
+            # Resets and broken pipes (WinError 10054 when a client hits Ctrl+C)
+            # end this connection only - the server goes back to accept()
+            try:
+                with conn:
+                    serve_connection(scraper, conn, logger)
+            except (OSError, EOFError) as e:
+                logger.warning(f"⚠️  Client connection dropped: {e}")
+
+def accept_client(listener, key, timeout=SERVER_CONNECT_TIMEOUT):
+    """Accept one connection and authenticate it, dropping clients that stall the handshake"""
+    sock, _ = listener.accept()
+    sock.setblocking(True)
+    conn = Connection(sock.detach())
+    result = {}
+    def handshake():
+        try:
+            deliver_challenge(conn, key)
+            answer_challenge(conn, key)
+        except (AuthenticationError, OSError, EOFError) as e:
+            result['error'] = e
+        else:
+            result['authenticated'] = True
+    
+    thread = threading.Thread(target=handshake, name='server-handshake', daemon=True)
+    thread.start()
+    thread.join(timeout)
+    if thread.is_alive():
+        # Shutting the socket down wakes the blocked handshake so its thread can exit
+        sock = socket.socket(fileno=conn.fileno())
+        try:
+            sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        finally:
+            sock.detach()
+        thread.join(timeout)
+        conn.close()
+        raise AuthenticationError(f"no handshake within {timeout}s")
+    if not result.get('authenticated'):
+        conn.close()
+        raise result.get('error') or AuthenticationError("handshake failed")
+    return conn
+
+def valid_job(job):
+    """Check that a message from a client is a {url, description} job"""
+    return (isinstance(job, dict)
+            and isinstance(job.get('url'), str)
+            and isinstance(job.get('description'), str))
+
+def recv_interruptibly(conn):
+    """Receive one message, waking up every second so Ctrl+C gets through on Windows"""
+    while not conn.poll(1):
+        pass
+    return conn.recv()
+
+def watch_client(conn, client_gone, job_done):
+    """Set `client_gone` if the client hangs up before `job_done` is set"""
+    # Clients send nothing while a job runs, so anything readable means EOF or a reset
+    while not job_done.is_set():
+        try:
+            if conn.poll(1):
+                break
+        except OSError:
+            break
+    else:
+        return
+    client_gone.set()
+
+def serve_connection(scraper, conn, logger):
+    """Run the jobs one client sends until it disconnects"""
+    while True:
+        try:
+            job = recv_interruptibly(conn)
+        except EOFError:
+            return
+        
+        if not valid_job(job):
+            logger.warning(f"⚠️  Ignoring malformed job: {job!r:.100}")
+            conn.send({'error': "expected a dict with 'url' and 'description' strings"})
+            continue
+        
+        logger.info(f"\n📥 Job from client: {job['description']}")
+        
+        # Jobs run one at a time, so a client's --no-cache can swap the cache out for the job
+        cache = scraper.cache
+        if not job.get('use_cache', True):
+            scraper.cache = CachedFetcher(None)
+        # A client that goes away stops the job at the next page or event
+        job_done = threading.Event()
+        watcher = threading.Thread(target=watch_client, args=(conn, scraper.stop_requested, job_done),
+                                   name='client-watch', daemon=True)
+        watcher.start()
+        try:
+            events_processed = scraper.scrape_from_url(job['url'], job['description'])
+        finally:
+            job_done.set()
+            watcher.join()
+            scraper.cache = cache
+        scraper.output.flush()
+        if scraper.stop_requested.is_set():
+            scraper.stop_requested.clear()
+            logger.warning(f"⚠️  Client disconnected - stopped {job['description']}")
+            return
+        conn.send({
+            'events_processed': events_processed,
+            'csv_filename': os.path.abspath(scraper.output.filename)
+        })
+
+def connect_to_server(logger, timeout=SERVER_CONNECT_TIMEOUT):
+    """Connect and authenticate to a --serve instance within `timeout` seconds, or return None"""
+    authkey = read_server_key()
+    if authkey is None:
+        logger.debug("No server key at %s - scraping in-process", SERVER_KEY_PATH)
+        return None
+    
+    result = {}
+    lock = threading.Lock()
+    def attempt():
+        try:
+            conn = Client(SERVER_ADDRESS, authkey=authkey)
+        except (OSError, EOFError, AuthenticationError) as e:
+            result['error'] = e
+            return
+        with lock:
+            if result.get('abandoned'):
+                conn.close()
+                return
+            result['conn'] = conn
+    
+    thread = threading.Thread(target=attempt, name='server-probe', daemon=True)
+    thread.start()
+    thread.join(timeout)
+    with lock:
+        conn = result.get('conn')
+        if conn is None:
+            result['abandoned'] = True
+    
+    if conn is not None:
+        return conn
+    if 'error' in result:
+        logger.debug("No scraper server on %s:%s (%s) - scraping in-process", *SERVER_ADDRESS, result['error'])
+    else:
+        logger.warning(f"⚠️  No answer from {SERVER_ADDRESS[0]}:{SERVER_ADDRESS[1]} within {timeout}s (server busy?) - scraping in-process")
+    return None
+
+def run_on_server(urls_to_scrape, logger, use_cache=True):
+    """Hand the URLs to a --serve instance - (events, URLs completed), or None if none answered"""
+    conn = connect_to_server(logger)
+    if conn is None:
+        return None
+    
+    logger.info(f"🔌 Connected to scraper server on {SERVER_ADDRESS[0]}:{SERVER_ADDRESS[1]}")
+    total_events_processed = 0
+    completed_urls = 0
+    with conn:
+        for i, url_info in enumerate(urls_to_scrape, 1):
+            logger.info(f"📤 URL {i}/{len(urls_to_scrape)}: {url_info['description']}")
+            try:
+                conn.send({**url_info, 'use_cache': use_cache})
+                reply = recv_interruptibly(conn)
+            except (OSError, EOFError) as e:
+                logger.error(f"❌ Lost connection to scraper server: {e}")
+                break
+            if 'error' in reply:
+                logger.error(f"❌ Server rejected URL {i}: {reply['error']}")
+                continue
+            total_events_processed += reply['events_processed']
+            completed_urls += 1
+            logger.info(f"✅ URL {i} completed: {reply['events_processed']} events processed")
+            logger.info(f"💾 Rows written to: {reply['csv_filename']}")
+    return total_events_processed, completed_urls
+
+def wait_for_enter():
+    """Keep a double-clicked console window open - skipped for scripted and scheduled runs"""
+    if sys.stdin is not None and sys.stdin.isatty() and os.environ.get("MTG_NONINTERACTIVE") != "1":
+        input("Press Enter to close...")
+
+def parse_args(argv=None):
+    """Parse the command line - URLs to scrape plus run options"""
+    parser = argparse.ArgumentParser(
+        description="Scrape MTGTop8 event decks into a CSV file",
+        epilog="Set MTG_NONINTERACTIVE=1 (or pass --batch) to exit without waiting for Enter."
+    )
+    parser.add_argument('urls', nargs='*', metavar='URL', help="MTGTop8 list page(s) to scrape")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="fetch every event page from the network instead of the on-disk cache")
+    parser.add_argument('--serve', action='store_true',
+                        help="stay running with a warm browser and scrape URLs sent by later runs")
+    parser.add_argument('--batch', action='store_true',
+                        help="never wait for Enter before exiting (sets MTG_NONINTERACTIVE=1)")
+    args = parser.parse_args(argv)
+    if args.serve and args.urls:
+        parser.error("--serve takes no URLs - pass them to a later run instead")
+    return args
+
 def main():
     """Main function - URL-based scraping with safe logging"""
     
@@ -588,24 +1346,25 @@ def main():
         logger.info("🚀 MTGTop8 URL-Based Scraper for Windows 11 x64")
         logger.info("🔗 Command Line Version - Pass URLs as arguments!")
         logger.info(f"📝 Logging to file: {log_filename}")
-        logger.info("=" * 60)
+        logger.info(SEP)
         
         # Log system information
-        logger.debug(f"Python version: {sys.version}")
-        logger.debug(f"Command line args: {sys.argv}")
+        logger.debug("Python version: %s", sys.version)
+        logger.debug("Command line args: %s", sys.argv)
+        args = parse_args()
+        if args.batch:
+            os.environ["MTG_NONINTERACTIVE"] = "1"
         
         # Check if URL was provided as command line argument
-        if len(sys.argv) > 1:
-            # URLs provided as command line arguments
+        if args.serve:
+            # --serve takes no URLs - its jobs come from later runs
             urls_to_scrape = []
-            for i, url in enumerate(sys.argv[1:], 1):
-                urls_to_scrape.append({
-                    "url": url,
-                    "description": f"URL {i}"
-                })
+        elif args.urls:
+            # URLs provided as command line arguments
+            urls_to_scrape = [{"url": url, "description": f"URL {i}"}
+                              for i, url in enumerate(args.urls, 1)]
             logger.info(f"📋 Processing {len(urls_to_scrape)} URL(s) from command line:")
-            for i, url_info in enumerate(urls_to_scrape, 1):
-                logger.info(f"   {i}. {url_info['url']}")
+            logger.info("\n".join(f"   {i}. {u['url']}" for i, u in enumerate(urls_to_scrape, 1)))
         else:
             # No command line arguments - use default
             logger.info("💡 No URL provided. Using default Standard URL.")
@@ -620,68 +1379,72 @@ def main():
                 }
             ]
         
-        start_time = time.time()
+        start_time = time.perf_counter()
+        
+        # A warm --serve instance already has a browser running - hand it the URLs
+        if not args.serve:
+            result = run_on_server(urls_to_scrape, logger, use_cache=not args.no_cache)
+            if result is not None:
+                total_events_processed, completed_urls = result
+                total_time = time.perf_counter() - start_time
+                if completed_urls == len(urls_to_scrape):
+                    logger.info(f"\n🎉 SCRAPING COMPLETED ON SERVER!")
+                else:
+                    logger.warning(f"\n⚠️  SCRAPING INCOMPLETE - {completed_urls}/{len(urls_to_scrape)} URL(s) finished on server")
+                logger.info(f"⏰ Total time: {total_time:.1f} seconds ({total_time/60:.1f} minutes)")
+                logger.info(f"📊 Total events processed: {total_events_processed}")
+                return
         
         # Initialize scraper
         try:
-            logger.info("🔧 Initializing browser...")
-            logger.debug("Setting up Chrome options for Windows x64...")
-            scraper = MTGTop8URLScraper()
+            logger.info("🔧 Initializing scraper...")
+            scraper = MTGTop8URLScraper(use_cache=not args.no_cache,
+                                        csv_filename=SERVER_CSV_FILENAME if args.serve else CSV_FILENAME)
         except Exception as e:
             logger.error(f"❌ FAILED TO START: {e}")
-            logger.debug(f"Browser initialization error: {traceback.format_exc()}")
-            input("Press Enter to close...")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Scraper initialization error: %s", traceback.format_exc())
+            wait_for_enter()
             return
         
         try:
-            logger.info(f"⏰ Started at: {time.strftime('%H:%M:%S')}")
-            
-            # Process each URL
-            total_events_processed = 0
-            for i, url_info in enumerate(urls_to_scrape, 1):
-                logger.info(f"\n{'='*60}")
-                logger.info(f"📄 URL {i}/{len(urls_to_scrape)}: {url_info['description']}")
-                logger.info(f"{'='*60}")
-                
-                logger.debug(f"Starting to process URL: {url_info['url']}")
-                
-                events_processed = scraper.scrape_from_url(
-                    url_info['url'], 
-                    url_info['description']
-                )
-                total_events_processed += events_processed
-                
-                logger.info(f"\n✅ URL {i} completed: {events_processed} events processed")
-                logger.debug(f"Total events processed so far: {total_events_processed}")
+            logger.info(f"⏰ Started at: {time.strftime(_H_M_S)}")
+            
+            if args.serve:
+                serve(scraper, logger)
+            
+            total_events_processed = scrape_urls(scraper, urls_to_scrape, logger)
                 
             # Save all collected data
-            logger.info(f"\n{'='*60}")
+            logger.info("\n%s", SEP)
             logger.info("💾 SAVING DATA...")
             logger.debug("Starting data save process...")
             scraper.save_data()
             
             # Final summary
-            total_time = time.time() - start_time
+            total_time = time.perf_counter() - start_time
             logger.info(f"\n🎉 SCRAPING COMPLETED SUCCESSFULLY!")
             logger.info(f"⏰ Total time: {total_time:.1f} seconds ({total_time/60:.1f} minutes)")
             logger.info(f"📊 Total events processed: {total_events_processed}")
-            logger.info(f"🕐 Completed at: {time.strftime('%H:%M:%S')}")
+            logger.info(f"🕐 Completed at: {time.strftime(_H_M_S)}")
             logger.info(f"📝 Complete log saved to: {log_filename}")
             
         except KeyboardInterrupt:
             logger.warning(f"\n⏹️  SCRAPING INTERRUPTED BY USER (Ctrl+C)")
             logger.debug("User interrupted with Ctrl+C")
-            if hasattr(scraper, 'all_events_data') and scraper.all_events_data:
-                logger.info("💾 Saving partial data...")
-                scraper.save_data()
+            if scraper.output.events_saved:
+                logger.info("💾 Flushing partial data...")
+                scraper.output.flush()
+                logger.info(f"✅ {scraper.output.decks_saved:,} decks from {scraper.output.events_saved:,} events in '{scraper.output.filename}'")
         except Exception as e:
             logger.error(f"\n❌ UNEXPECTED ERROR: {e}")
             logger.error(f"Error type: {type(e).__name__}")
-            logger.debug(f"Full error traceback: {traceback.format_exc()}")
-            if hasattr(scraper, 'all_events_data') and scraper.all_events_data:
-                logger.info("💾 Saving partial data...")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Full error traceback: %s", traceback.format_exc())
+            if scraper.output.events_saved:
+                logger.info("💾 Flushing partial data...")
                 try:
-                    scraper.save_data()
+                    scraper.output.flush()
                 except Exception as save_error:
                     logger.error(f"❌ Error saving partial data: {save_error}")
         finally:
@@ -700,8 +1463,10 @@ def main():
         print(traceback.format_exc())
     
     finally:
+        # Write out buffered log records before waiting on the user
+        flush_logging(logger)
         print(f"\n📝 Log file: {log_filename}")
-        input("Press Enter to close...")
+        wait_for_enter()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file